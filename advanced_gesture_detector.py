@@ -6,24 +6,159 @@ Recognizes complex hand poses and motion gestures
 
 import cv2
 import numpy as np
+import os
 import time
 from typing import Optional, Tuple, List
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 import math
+import multiprocessing
+from utils import njit
+
+try:
+    import mediapipe as mp
+except ImportError:
+    mp = None
+
+# Landmark indices (base joint, middle joint, tip) used to test finger extension
+FINGER_JOINTS = (
+    (2, 3, 4),     # Thumb: MCP - IP - TIP
+    (5, 6, 8),     # Index: MCP - PIP - TIP
+    (9, 10, 12),   # Middle
+    (13, 14, 16),  # Ring
+    (17, 18, 20),  # Pinky
+)
+PALM_CENTER_LANDMARK = 9  # Middle finger MCP
+
+@dataclass
+class HandFeatures:
+    """Contour-derived hand features, computed once per detection"""
+    contour_xy: np.ndarray  # (N, 2) int32 contour points
+    area: float
+    hull_idx: np.ndarray
+    hull_area: float
+    defects: Optional[np.ndarray]
+    bbox: Tuple[int, int, int, int]
+    moments: dict
+    min_rect: Tuple[Tuple[float, float], Tuple[float, float], float]  # ((cx, cy), (w, h), angle)
+
+@njit(cache=True, fastmath=True)
+def _defect_features(contour_xy, defects):
+    """
+    Compute finger gaps from convexity defects in a single native loop
+    Returns: (finger_count, defect_depths, far point indices of finger gaps)
+    """
+    n = defects.shape[0]
+    depths = np.empty(n, dtype=np.float64)
+    finger_far = np.empty(n, dtype=np.int32)
+    depth_count = 0
+    finger_count = 0
+    
+    for i in range(n):
+        s = defects[i, 0]
+        e = defects[i, 1]
+        f = defects[i, 2]
+        d = defects[i, 3]
+        
+        sx, sy = contour_xy[s, 0], contour_xy[s, 1]
+        ex, ey = contour_xy[e, 0], contour_xy[e, 1]
+        fx, fy = contour_xy[f, 0], contour_xy[f, 1]
+        
+        # Squared triangle sides
+        a2 = (ex - sx) ** 2 + (ey - sy) ** 2
+        b2 = (fx - sx) ** 2 + (fy - sy) ** 2
+        c2 = (ex - fx) ** 2 + (ey - fy) ** 2
+        
+        if b2 > 0 and c2 > 0:
+            depths[depth_count] = d / 256.0
+            depth_count += 1
+            
+            # Cosine rule: angle <= pi/2 when a^2 <= b^2 + c^2;
+            # depth is fixed-point (x256), so depth > 20 px is d > 5120
+            if a2 <= b2 + c2 and d > 5120:
+                finger_far[finger_count] = f
+                finger_count += 1
+    
+    return finger_count, depths[:depth_count], finger_far[:finger_count]
+
+class MediaPipeHandBackend:
+    """
+    Hand landmark backend using MediaPipe Hands (palm detector + landmark model)
+    """
+    
+    def __init__(self, min_detection_confidence=0.7, min_tracking_confidence=0.5, model_complexity=0):
+        # model_complexity=0 selects the lite (quantized) landmark model
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=1,
+            model_complexity=model_complexity,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+    
+    def process(self, frame) -> Optional[np.ndarray]:
+        """
+        Run hand landmark detection on a BGR frame
+        Returns: (21, 2) array of landmark pixel coordinates, or None if no hand
+        """
+        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        
+        if not results.multi_hand_landmarks:
+            return None
+        
+        h, w = frame.shape[:2]
+        landmarks = results.multi_hand_landmarks[0].landmark
+        return np.array([(lm.x * w, lm.y * h) for lm in landmarks], dtype=np.float32)
+    
+    def close(self):
+        """Release MediaPipe resources"""
+        self.hands.close()
 
 class AdvancedGestureDetector:
     """
     Advanced gesture detector for complex hand poses and motion gestures
     """
     
-    def __init__(self):
+    def __init__(self, use_mediapipe=True, min_detection_confidence=0.7, min_tracking_confidence=0.5,
+                 use_opencl=True):
+        # Landmark backend replaces the skin-mask pipeline when available
+        self.landmark_backend = None
+        if use_mediapipe:
+            if mp is not None:
+                try:
+                    self.landmark_backend = MediaPipeHandBackend(min_detection_confidence, min_tracking_confidence)
+                except Exception as e:
+                    # e.g. an incompatible mediapipe build or missing model files
+                    print(f"⚠️  MediaPipe initialization failed: {e} - falling back to OpenCV contour detection")
+            else:
+                print("⚠️  MediaPipe not installed - falling back to OpenCV contour detection")
+        
+        # OpenCL (T-API) offload of the per-pixel segmentation passes
+        self.use_opencl = False
+        if use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            self.use_opencl = cv2.ocl.haveOpenCL()
+        
         self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(detectShadows=False)
-        self.kernel = np.ones((5, 5), np.uint8)
+        # Sized for the half-resolution mask (about 5x5 at full resolution)
+        self.kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
         self.calibrated = False
         self.calibration_frames = 0
         
+        # Rotating hue by 90 makes both red skin bands (0-17, 160-179) one contiguous range
+        identity = np.arange(256, dtype=np.uint8)
+        rotated_hue = ((np.arange(256) + 90) % 180).astype(np.uint8)
+        self.hue_rotate_lut = np.dstack([rotated_hue, identity, identity]).reshape(256, 1, 3)
+        self.lower_skin = np.array([70, 30, 80], dtype=np.uint8)
+        self.upper_skin = np.array([107, 255, 255], dtype=np.uint8)
+        
         # Motion tracking
-        self.hand_positions = deque(maxlen=15)  # Track last 15 positions
+        # Ring buffer of the last 15 hand positions as (x, y, timestamp) rows
+        self.max_positions = 15
+        self._pos = np.zeros((self.max_positions, 3), dtype=np.float64)
+        self._pos_n = 0
+        self._pos_idx = 0
         self.gesture_history = deque(maxlen=10)  # Track last 10 gestures
         
         # Gesture definitions
@@ -43,338 +178,543 @@ class AdvancedGestureDetector:
             'open_hand': '✋ Open Hand'
         }
         
+        # Per-frame results (hand center and static pose of the last detect_gesture call)
+        self.last_hand_center = None
+        self.last_static_gesture = None
+        
         # Motion thresholds
         self.min_motion_distance = 80
         self.wave_frequency_threshold = 3
         
+        # Idle-frame skipping and hand tracking (contour fallback)
+        self.motion_pixel_threshold = 125  # Foreground pixels on the half-resolution frame
+        self.idle_frame_limit = 5
+        self.frames_since_hand = self.idle_frame_limit
+        self.last_hand_box = None
+        
     def calibrate(self, frame):
         """Calibrate background subtractor"""
+        if self.landmark_backend is not None:
+            # Landmark model needs no background model
+            self.calibrated = True
+            return True
+        
         if self.calibration_frames < 30:
-            self.bg_subtractor.apply(frame)
+            self.bg_subtractor.apply(self._background_frame(frame))
             self.calibration_frames += 1
             return False
         else:
             self.calibrated = True
             return True
     
-    def detect_gesture(self, frame) -> Tuple[Optional[str], np.ndarray]:
+    def detect_gesture(self, frame, draw: bool = True) -> Tuple[Optional[str], Optional[np.ndarray]]:
         """
         Detect complex gestures in frame
-        Returns: (gesture_name, annotated_frame)
+        Returns: (gesture_name, annotated_frame), annotated_frame is None when draw is False
         """
-        annotated_frame = frame.copy()
+        annotated_frame = frame.copy() if draw else None
+        self.last_hand_center = None
+        self.last_static_gesture = None
         
         if not self.calibrated:
             if not self.calibrate(frame):
-                cv2.putText(annotated_frame, "Calibrating... Keep hand out of view", 
-                           (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+                if draw:
+                    cv2.putText(annotated_frame, "Calibrating... Keep hand out of view", 
+                               (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
                 return None, annotated_frame
         
+        if self.landmark_backend is not None:
+            return self._detect_from_landmarks(frame, annotated_frame)
+        
         # Focus on detection zone
         h, w = frame.shape[:2]
-        roi = frame[0:int(h*0.8), int(w*0.1):int(w*0.9)]  # Larger detection area
+        zone = (int(w*0.1), 0, int(w*0.9), int(h*0.8))  # Larger detection area
+        
+        gesture_name = None
+        
+        # Skip the whole pipeline on static scenes once the hand has been gone a while
+        if self._scene_has_motion(frame) or self.frames_since_hand < self.idle_frame_limit:
+            gesture_name = self._detect_in_region(frame, annotated_frame, self._search_region(zone))
+        else:
+            self.frames_since_hand += 1
+        
+        if draw:
+            # Show detection area
+            cv2.rectangle(annotated_frame, (zone[0], zone[1]), (zone[2], zone[3]), (255, 0, 0), 2)
+            cv2.putText(annotated_frame, "Detection Zone", (zone[0], 25), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
+            
+            # Draw motion trail
+            self._draw_motion_trail(annotated_frame)
+        
+        return gesture_name, annotated_frame
+    
+    def _background_frame(self, frame) -> np.ndarray:
+        """Downscaled frame fed to the background subtractor"""
+        return cv2.resize(frame, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+    
+    def _scene_has_motion(self, frame) -> bool:
+        """Check the background subtractor for enough foreground pixels"""
+        fgmask = self.bg_subtractor.apply(self._background_frame(frame), learningRate=0.001)
+        return cv2.countNonZero(fgmask) >= self.motion_pixel_threshold
+    
+    def _search_region(self, zone) -> Tuple[int, int, int, int]:
+        """Track around the last hand when it was seen in the previous frame"""
+        if self.frames_since_hand == 0 and self.last_hand_box is not None:
+            x, y, bw, bh = self.last_hand_box
+            margin_x, margin_y = bw // 2, bh // 2
+            x0 = max(zone[0], x - margin_x)
+            y0 = max(zone[1], y - margin_y)
+            x1 = min(zone[2], x + bw + margin_x)
+            y1 = min(zone[3], y + bh + margin_y)
+            if x1 - x0 >= 32 and y1 - y0 >= 32:
+                return x0, y0, x1, y1
+        
+        return zone
+    
+    def _detect_in_region(self, frame, annotated_frame, region) -> Optional[str]:
+        """Run skin segmentation and pose analysis inside a frame region"""
+        offset_x, offset_y, x1, y1 = region
+        roi = frame[offset_y:y1, offset_x:x1]
+        
+        # Keep the per-pixel passes on the OpenCL device when available
+        if self.use_opencl:
+            roi = cv2.UMat(roi)
+        
+        # Run segmentation at half resolution; hand contours are coarse
+        small = cv2.resize(roi, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
         
         # Enhanced skin detection
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        
+        # Both skin hue bands in a single range check on the rotated hue
+        hsv = cv2.LUT(hsv, self.hue_rotate_lut)
+        mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin)
         
-        # Multiple skin tone ranges for better detection
-        mask1 = cv2.inRange(hsv, np.array([0, 30, 80]), np.array([17, 255, 255]))
-        mask2 = cv2.inRange(hsv, np.array([160, 30, 80]), np.array([179, 255, 255]))
-        mask = cv2.bitwise_or(mask1, mask2)
+        # Advanced noise reduction, scaled down with the mask so finger gaps survive
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.kernel, iterations=1)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.kernel, iterations=1)
         
-        # Advanced noise reduction
-        kernel_small = np.ones((3, 3), np.uint8)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel_small, iterations=2)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.kernel, iterations=2)
+        # findContours runs on the CPU
+        if self.use_opencl:
+            mask = mask.get()
         
         # Find contours
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
+        hand_contour = self._find_best_hand_contour(contours) if contours else None
+        
+        if hand_contour is None:
+            self.frames_since_hand += 1
+            return None
+        
+        # Scale contour back to ROI resolution
+        hand_contour = hand_contour * 2
+        
+        features = self._compute_hand_features(hand_contour)
+        
+        # Adjust coordinates back to full frame
+        adjusted_contour = hand_contour + [offset_x, offset_y]
+        bx, by, bw, bh = features.bbox
+        self.last_hand_box = (bx + offset_x, by + offset_y, bw, bh)
+        self.frames_since_hand = 0
+        
+        # Draw hand contour
+        if annotated_frame is not None:
+            cv2.drawContours(annotated_frame, [adjusted_contour], -1, (0, 255, 0), 2)
+        
+        # Hand center for motion tracking (center of the minimum-area rectangle)
+        (rect_cx, rect_cy), _, _ = features.min_rect
+        hand_center = (int(rect_cx) + offset_x, int(rect_cy) + offset_y)
+        
+        # Track hand position
+        self._add_hand_position(hand_center)
+        
+        # Draw hand center
+        if annotated_frame is not None:
+            cv2.circle(annotated_frame, hand_center, 8, (255, 0, 255), -1)
+        
+        # Detect static pose
+        static_gesture = self._detect_static_pose(features, annotated_frame, offset_x, offset_y)
+        self.last_hand_center = hand_center
+        self.last_static_gesture = static_gesture
+        
+        # Detect motion gesture
+        motion_gesture = self._detect_motion_gesture()
+        
+        # Prioritize motion gestures over static poses
+        gesture_name = motion_gesture if motion_gesture else static_gesture
+        
+        # Add gesture info to frame
+        if gesture_name and annotated_frame is not None:
+            gesture_display = self.gesture_names.get(gesture_name, gesture_name)
+            cv2.putText(annotated_frame, f"Gesture: {gesture_display}", 
+                       (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+        
+        return gesture_name
+    
+    def _detect_from_landmarks(self, frame, annotated_frame) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """Detect gestures from MediaPipe hand landmarks"""
+        landmarks = self.landmark_backend.process(frame)
+        draw = annotated_frame is not None
+        
         gesture_name = None
         
-        if contours:
-            # Find the best hand contour
-            hand_contour = self._find_best_hand_contour(contours)
+        if landmarks is not None:
+            points = landmarks.astype(np.int32)
+            
+            # Draw finger skeletons
+            if draw:
+                for base, mid, tip in FINGER_JOINTS:
+                    chain = points[[0, base, mid, tip]].reshape(-1, 1, 2)
+                    cv2.polylines(annotated_frame, [chain], False, (0, 255, 0), 2)
+            
+            # Palm center for motion tracking
+            hand_center = (int(points[PALM_CENTER_LANDMARK][0]), int(points[PALM_CENTER_LANDMARK][1]))
+            self._add_hand_position(hand_center)
+            if draw:
+                cv2.circle(annotated_frame, hand_center, 8, (255, 0, 255), -1)
+            
+            static_gesture = self._classify_landmark_gesture(landmarks)
+            self.last_hand_center = hand_center
+            self.last_static_gesture = static_gesture
+            motion_gesture = self._detect_motion_gesture()
+            
+            # Prioritize motion gestures over static poses
+            gesture_name = motion_gesture if motion_gesture else static_gesture
             
-            if hand_contour is not None:
-                # Adjust coordinates back to full frame
-                offset_x = int(w*0.1)
-                offset_y = 0
-                adjusted_contour = hand_contour + [offset_x, offset_y]
-                
-                # Draw hand contour
-                cv2.drawContours(annotated_frame, [adjusted_contour], -1, (0, 255, 0), 2)
-                
-                # Get hand center for motion tracking
-                M = cv2.moments(hand_contour)
-                if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"]) + offset_x
-                    cy = int(M["m01"] / M["m00"]) + offset_y
-                    hand_center = (cx, cy)
-                    
-                    # Track hand position
-                    self.hand_positions.append((hand_center, time.time()))
-                    
-                    # Draw hand center
-                    cv2.circle(annotated_frame, hand_center, 8, (255, 0, 255), -1)
-                    
-                    # Detect static pose
-                    static_gesture = self._detect_static_pose(hand_contour, annotated_frame, offset_x, offset_y)
-                    
-                    # Detect motion gesture
-                    motion_gesture = self._detect_motion_gesture()
-                    
-                    # Prioritize motion gestures over static poses
-                    gesture_name = motion_gesture if motion_gesture else static_gesture
-                    
-                    # Add gesture info to frame
-                    if gesture_name:
-                        gesture_display = self.gesture_names.get(gesture_name, gesture_name)
-                        cv2.putText(annotated_frame, f"Gesture: {gesture_display}", 
-                                   (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-        
-        # Show detection area
-        cv2.rectangle(annotated_frame, (int(w*0.1), 0), (int(w*0.9), int(h*0.8)), (255, 0, 0), 2)
-        cv2.putText(annotated_frame, "Detection Zone", (int(w*0.1), 25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
-        
-        # Draw motion trail
-        self._draw_motion_trail(annotated_frame)
+            if gesture_name and draw:
+                gesture_display = self.gesture_names.get(gesture_name, gesture_name)
+                cv2.putText(annotated_frame, f"Gesture: {gesture_display}", 
+                           (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+        
+        if draw:
+            self._draw_motion_trail(annotated_frame)
         
         return gesture_name, annotated_frame
     
+    def _finger_states(self, landmarks) -> List[bool]:
+        """Determine which fingers are extended from MCP-PIP-TIP joint angles"""
+        palm_size = np.linalg.norm(landmarks[PALM_CENTER_LANDMARK] - landmarks[0])
+        states = []
+        
+        for base, mid, tip in FINGER_JOINTS:
+            v1 = landmarks[base] - landmarks[mid]
+            v2 = landmarks[tip] - landmarks[mid]
+            norm = np.linalg.norm(v1) * np.linalg.norm(v2)
+            
+            # Straight finger: angle at the middle joint close to 180 degrees
+            straight = norm > 0 and np.dot(v1, v2) / norm < -0.8
+            states.append(bool(straight))
+        
+        # Thumb also has to be held away from the palm
+        thumb_spread = np.linalg.norm(landmarks[4] - landmarks[5])
+        states[0] = states[0] and bool(thumb_spread > palm_size * 0.5)
+        
+        return states
+    
+    def _classify_landmark_gesture(self, landmarks) -> Optional[str]:
+        """Classify static gesture based on landmark vectors"""
+        states = self._finger_states(landmarks)
+        thumb, index, middle, ring, pinky = states
+        finger_count = sum(states)
+        palm_size = np.linalg.norm(landmarks[PALM_CENTER_LANDMARK] - landmarks[0])
+        
+        if palm_size == 0:
+            return None
+        
+        # OK sign: thumb and index tips touching, remaining fingers extended
+        if np.linalg.norm(landmarks[4] - landmarks[8]) < palm_size * 0.3 and middle and ring and pinky:
+            return 'ok'
+        
+        if finger_count == 0:
+            return 'fist'
+        
+        if finger_count == 5:
+            return 'open_hand'
+        
+        if thumb and not (index or middle or ring or pinky):
+            # Image y grows downwards: thumb tip above its MCP means thumbs up
+            if landmarks[4][1] < landmarks[2][1]:
+                return 'thumbs_up'
+            return 'thumbs_down'
+        
+        if index and middle and not (ring or pinky):
+            # Crossed fingers swap the left/right order of the tips
+            base_order = landmarks[5][0] - landmarks[9][0]
+            tip_order = landmarks[8][0] - landmarks[12][0]
+            if base_order * tip_order < 0:
+                return 'crossed'
+            return 'peace'
+        
+        if index and pinky and not (middle or ring):
+            return 'love' if thumb else 'rock'
+        
+        if thumb and pinky and not (index or middle or ring):
+            return 'call_me'
+        
+        return None
+    
     def _find_best_hand_contour(self, contours) -> Optional[np.ndarray]:
         """Find the best contour that represents a hand"""
-        valid_contours = []
+        areas = np.array([cv2.contourArea(contour) for contour in contours])
         
-        for contour in contours:
-            area = cv2.contourArea(contour)
+        # Hand-sized area (on the half-resolution mask)
+        candidates = np.flatnonzero((areas > 500) & (areas < 6250))
+        
+        # Check shapes largest first: the first match is the largest valid contour
+        for i in candidates[np.argsort(-areas[candidates])]:
+            contour = contours[i]
+            area = areas[i]
+            
+            perimeter = cv2.arcLength(contour, True)
+            if perimeter <= 0:
+                continue
+            
+            # Hands are not too circular or too elongated
+            circularity = 4 * np.pi * area / (perimeter * perimeter)
+            if not 0.1 < circularity < 0.9:
+                continue
             
-            # Hand-sized area
-            if 2000 < area < 25000:
-                # Check shape characteristics
-                perimeter = cv2.arcLength(contour, True)
-                if perimeter > 0:
-                    circularity = 4 * np.pi * area / (perimeter * perimeter)
-                    
-                    # Hands are not too circular or too elongated
-                    if 0.1 < circularity < 0.9:
-                        # Check aspect ratio
-                        x, y, w, h = cv2.boundingRect(contour)
-                        aspect_ratio = float(w) / h
-                        
-                        # Reasonable aspect ratio for hands
-                        if 0.3 < aspect_ratio < 3.0:
-                            valid_contours.append((contour, area))
-        
-        if valid_contours:
-            # Return the largest valid contour
-            return max(valid_contours, key=lambda x: x[1])[0]
+            # Reasonable aspect ratio for hands
+            x, y, w, h = cv2.boundingRect(contour)
+            aspect_ratio = float(w) / h
+            if 0.3 < aspect_ratio < 3.0:
+                return contour
         
         return None
     
-    def _detect_static_pose(self, contour, frame, offset_x, offset_y) -> Optional[str]:
-        """Detect static hand poses"""
-        area = cv2.contourArea(contour)
+    def _compute_hand_features(self, contour) -> HandFeatures:
+        """Compute contour features shared by pose detection and tracking"""
+        contour_xy = np.ascontiguousarray(contour.reshape(-1, 2), dtype=np.int32)
         
-        # Calculate convex hull and defects
-        hull = cv2.convexHull(contour, returnPoints=False)
+        # Calculate convex hull (indices) and defects
+        hull_idx = cv2.convexHull(contour, returnPoints=False)
+        hull_area = cv2.contourArea(contour_xy[hull_idx[:, 0]])
         
-        if len(hull) > 3:
+        defects = None
+        if len(hull_idx) > 3:
             try:
-                defects = cv2.convexityDefects(contour, hull)
-                
-                if defects is not None:
-                    # Analyze hand shape characteristics
-                    finger_count, defect_depths = self._analyze_convexity_defects(contour, defects, frame, offset_x, offset_y)
-                    
-                    # Get bounding rectangle for orientation analysis
-                    x, y, w, h = cv2.boundingRect(contour)
-                    aspect_ratio = float(w) / h
-                    
-                    # Calculate solidity
-                    hull_area = cv2.contourArea(cv2.convexHull(contour))
-                    solidity = area / hull_area if hull_area > 0 else 0
-                    
-                    # Gesture classification based on multiple features
-                    return self._classify_static_gesture(finger_count, defect_depths, area, aspect_ratio, solidity, contour)
-                    
+                defects = cv2.convexityDefects(contour, hull_idx)
             except cv2.error:
                 pass
         
-        return None
+        return HandFeatures(
+            contour_xy=contour_xy,
+            area=cv2.contourArea(contour),
+            hull_idx=hull_idx,
+            hull_area=hull_area,
+            defects=defects,
+            bbox=cv2.boundingRect(contour),
+            moments=cv2.moments(contour),
+            min_rect=cv2.minAreaRect(contour_xy)
+        )
     
-    def _analyze_convexity_defects(self, contour, defects, frame, offset_x, offset_y) -> Tuple[int, List[float]]:
+    def _detect_static_pose(self, features: HandFeatures, frame, offset_x, offset_y) -> Optional[str]:
+        """Detect static hand poses"""
+        if features.defects is None:
+            return None
+        
+        # Analyze hand shape characteristics
+        finger_count, defect_depths = self._analyze_convexity_defects(features, frame, offset_x, offset_y)
+        
+        # Rotation-invariant elongation from the minimum-area rectangle
+        _, (rect_w, rect_h), _ = features.min_rect
+        short_side = min(rect_w, rect_h)
+        aspect_ratio = max(rect_w, rect_h) / short_side if short_side > 0 else 0
+        
+        # Calculate solidity
+        solidity = features.area / features.hull_area if features.hull_area > 0 else 0
+        
+        # Gesture classification based on multiple features
+        return self._classify_static_gesture(finger_count, defect_depths, aspect_ratio, solidity, features)
+    
+    def _analyze_convexity_defects(self, features: HandFeatures, frame, offset_x, offset_y) -> Tuple[int, np.ndarray]:
         """Analyze convexity defects to understand hand shape"""
-        finger_count = 0
-        defect_depths = []
+        contour_xy = features.contour_xy
+        defects = np.ascontiguousarray(features.defects.reshape(-1, 4), dtype=np.int32)
+        
+        finger_count, defect_depths, finger_far = _defect_features(contour_xy, defects)
+        
+        # Draw defect points for debugging
+        if frame is None:
+            return int(finger_count), defect_depths
+        
+        for f in finger_far:
+            far = contour_xy[f]
+            cv2.circle(frame, (int(far[0]) + offset_x, int(far[1]) + offset_y), 5, (255, 0, 0), -1)
         
-        for i in range(defects.shape[0]):
-            s, e, f, d = defects[i, 0]
+        return int(finger_count), defect_depths
+    
+    def _classify_static_gesture(self, finger_count, defect_depths, aspect_ratio, solidity, features: HandFeatures) -> Optional[str]:
+        """Classify static gesture based on hand features (decision tree on finger count)"""
+        
+        if finger_count == 0:
+            # Very compact hand (fist)
+            if solidity > 0.85 and len(defect_depths) <= 1:
+                return 'fist'
             
-            start = tuple(contour[s][0])
-            end = tuple(contour[e][0])
-            far = tuple(contour[f][0])
+            if self._is_ok_sign(defect_depths, aspect_ratio, solidity):
+                return 'ok'
             
-            # Calculate triangle sides
-            a = np.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
-            b = np.sqrt((far[0] - start[0])**2 + (far[1] - start[1])**2)
-            c = np.sqrt((end[0] - far[0])**2 + (end[1] - far[1])**2)
+            # Thumbs up/down: shape elongated sideways with the thumb. This gate uses the
+            # axis-aligned width/height (as the centroid test below assumes), not the
+            # rotation-invariant ratio, which any upright fist plus finger would pass
+            _, _, w, h = features.bbox
+            if h > 0 and float(w) / h > 1.5:
+                return self._thumb_direction(features)
             
-            if b > 0 and c > 0:
-                # Calculate angle using cosine rule
-                angle = np.arccos((b**2 + c**2 - a**2) / (2*b*c))
-                
-                # Depth of defect
-                depth = d / 256.0
-                defect_depths.append(depth)
-                
-                # Count as finger if angle is acute and depth is significant
-                if angle <= np.pi/2 and depth > 20:
-                    finger_count += 1
-                    
-                    # Draw defect points for debugging
-                    cv2.circle(frame, (far[0] + offset_x, far[1] + offset_y), 5, (255, 0, 0), -1)
-        
-        return finger_count, defect_depths
-    
-    def _classify_static_gesture(self, finger_count, defect_depths, area, aspect_ratio, solidity, contour) -> Optional[str]:
-        """Classify static gesture based on hand features"""
-        
-        # Very compact hand (fist)
-        if solidity > 0.85 and len(defect_depths) <= 1:
-            return 'fist'
-        
-        # Very open hand
-        if solidity < 0.65 and finger_count >= 3:
-            return 'open_hand'
+            return None
         
-        # OK sign: circular shape with hole in middle
-        if len(defect_depths) >= 1 and max(defect_depths) > 30 and solidity < 0.8:
-            if 0.7 < aspect_ratio < 1.3:  # Roughly square
+        if finger_count == 1:
+            # Very compact hand (fist)
+            if solidity > 0.85 and len(defect_depths) <= 1:
+                return 'fist'
+            
+            if self._is_ok_sign(defect_depths, aspect_ratio, solidity):
                 return 'ok'
-        
-        # Peace sign: two extended fingers
-        if finger_count == 1 and len(defect_depths) >= 1:  # One gap between two fingers
-            if aspect_ratio > 1.2:  # Taller than wide
+            
+            # Peace sign: one gap between two extended fingers
+            if aspect_ratio > 1.2:
                 return 'peace'
+            
+            # Fingers crossed: overlapping fingers
+            if solidity > 0.75:
+                return 'crossed'
+            
+            return None
         
-        # Thumbs up/down: elongated shape with thumb
-        if finger_count <= 1 and aspect_ratio > 1.5:
-            # Use contour orientation to determine up vs down
-            moments = cv2.moments(contour)
-            if moments["m00"] != 0:
-                # Simple heuristic: if the hand is more towards top, it's thumbs up
-                centroid_y = moments["m01"] / moments["m00"]
-                _, y, _, h = cv2.boundingRect(contour)
-                
-                if centroid_y < y + h * 0.4:  # Centroid in upper part
-                    return 'thumbs_up'
-                elif centroid_y > y + h * 0.6:  # Centroid in lower part
-                    return 'thumbs_down'
-        
-        # Rock sign: extended pinky and index
-        if finger_count == 2 and len(defect_depths) >= 2:
+        if finger_count == 2:
+            if self._is_ok_sign(defect_depths, aspect_ratio, solidity):
+                return 'ok'
+            
+            # Rock sign: extended pinky and index
             if 1.0 < aspect_ratio < 2.0:
                 return 'rock'
-        
-        # Love sign: three fingers (index, middle, pinky)
-        if finger_count == 2 and len(defect_depths) >= 2:
+            
+            # Love sign: three fingers (index, middle, pinky)
             if solidity < 0.7:
                 return 'love'
+            
+            return None
         
-        # Call me: thumb and pinky extended
-        if finger_count == 1 and aspect_ratio > 1.8:
-            return 'call_me'
+        # Very open hand
+        if solidity < 0.65:
+            return 'open_hand'
+        
+        if self._is_ok_sign(defect_depths, aspect_ratio, solidity):
+            return 'ok'
+        
+        return None
+    
+    def _is_ok_sign(self, defect_depths, aspect_ratio, solidity) -> bool:
+        """OK sign: roughly square shape with a deep hole in the middle"""
+        return (len(defect_depths) >= 1 and max(defect_depths) > 30 and solidity < 0.8
+                and 0.7 < aspect_ratio < 1.3)
+    
+    def _thumb_direction(self, features: HandFeatures) -> Optional[str]:
+        """Tell thumbs up from thumbs down by where the hand mass sits"""
+        moments = features.moments
+        if moments["m00"] == 0:
+            return None
         
-        # Fingers crossed: overlapping fingers
-        if finger_count == 1 and solidity > 0.75:
-            return 'crossed'
+        # Simple heuristic: if the hand is more towards top, it's thumbs up
+        centroid_y = moments["m01"] / moments["m00"]
+        _, y, _, h = features.bbox
+        
+        if centroid_y < y + h * 0.4:  # Centroid in upper part
+            return 'thumbs_up'
+        elif centroid_y > y + h * 0.6:  # Centroid in lower part
+            return 'thumbs_down'
         
         return None
     
     def _detect_motion_gesture(self) -> Optional[str]:
         """Detect motion-based gestures"""
-        if len(self.hand_positions) < 5:
+        if self._pos_n < 5:
             return None
         
-        # Get recent positions
-        recent_positions = list(self.hand_positions)[-10:]
+        # Get recent positions (shared by both detectors)
+        recent_positions = self.positions_view(10)
+        xs = recent_positions[:, 0]
+        ys = recent_positions[:, 1]
         
         # Wave detection: oscillating motion
-        if self._detect_wave_motion(recent_positions):
+        if self._detect_wave_motion(xs):
             return 'wave'
         
         # Swipe detection: consistent horizontal movement
-        swipe = self._detect_swipe_motion(recent_positions)
+        swipe = self._detect_swipe_motion(xs, ys)
         if swipe:
             return swipe
         
         return None
     
-    def _detect_wave_motion(self, positions) -> bool:
+    def _detect_wave_motion(self, xs) -> bool:
         """Detect waving motion (oscillating horizontal movement)"""
-        if len(positions) < 8:
+        if len(xs) < 8:
             return False
         
-        # Extract x coordinates and times
-        x_coords = [pos[0][0] for pos in positions]
-        times = [pos[1] for pos in positions]
-        
-        # Check for oscillation in x direction
-        direction_changes = 0
-        for i in range(1, len(x_coords) - 1):
-            if (x_coords[i] - x_coords[i-1]) * (x_coords[i+1] - x_coords[i]) < 0:
-                direction_changes += 1
+        # Count sign changes of consecutive x steps
+        d = np.diff(xs)
+        direction_changes = int(np.count_nonzero(d[:-1] * d[1:] < 0))
         
         # Wave should have multiple direction changes
         return direction_changes >= self.wave_frequency_threshold
     
-    def _detect_swipe_motion(self, positions) -> Optional[str]:
+    def _detect_swipe_motion(self, xs, ys) -> Optional[str]:
         """Detect swipe left/right gestures"""
-        if len(positions) < 5:
+        if len(xs) < 5:
             return None
         
         # Calculate total displacement
-        start_pos = positions[0][0]
-        end_pos = positions[-1][0]
-        
-        dx = end_pos[0] - start_pos[0]
-        dy = end_pos[1] - start_pos[1]
+        dx = int(xs[-1] - xs[0])
+        dy = int(ys[-1] - ys[0])
         
         # Check if movement is primarily horizontal
         if abs(dx) > abs(dy) * 2 and abs(dx) > self.min_motion_distance:
             # Check if movement is consistent (not too much back and forth)
-            x_coords = [pos[0][0] for pos in positions]
+            d = np.diff(xs)
             
             if dx > 0:  # Moving right
-                # Check if generally moving right
-                increasing = sum(1 for i in range(1, len(x_coords)) if x_coords[i] > x_coords[i-1])
-                if increasing > len(x_coords) * 0.6:
+                increasing = int(np.count_nonzero(d > 0))
+                if increasing > len(xs) * 0.6:
                     return 'swipe_right'
             else:  # Moving left
-                # Check if generally moving left
-                decreasing = sum(1 for i in range(1, len(x_coords)) if x_coords[i] < x_coords[i-1])
-                if decreasing > len(x_coords) * 0.6:
+                decreasing = int(np.count_nonzero(d < 0))
+                if decreasing > len(xs) * 0.6:
                     return 'swipe_left'
         
         return None
     
+    def _add_hand_position(self, hand_center):
+        """Record a hand position in the motion ring buffer"""
+        self._pos[self._pos_idx] = (hand_center[0], hand_center[1], time.time())
+        self._pos_idx = (self._pos_idx + 1) % self.max_positions
+        self._pos_n = min(self.max_positions, self._pos_n + 1)
+    
+    def positions_view(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        Get the last count tracked positions in chronological order
+        Returns: (N, 3) array of (x, y, timestamp) rows
+        """
+        n = self._pos_n if count is None else min(count, self._pos_n)
+        
+        # Until the buffer wraps, positions are already in order (zero-copy view)
+        if self._pos_n < self.max_positions:
+            return self._pos[self._pos_n - n:self._pos_n]
+        
+        return np.roll(self._pos, -self._pos_idx, axis=0)[self.max_positions - n:]
+    
     def _draw_motion_trail(self, frame):
         """Draw motion trail of hand movement"""
-        if len(self.hand_positions) < 2:
+        if self._pos_n < 2:
             return
         
-        # Draw trail
-        points = [pos[0] for pos in self.hand_positions]
+        # Draw trail in a single call
+        points = self.positions_view()[:, :2].astype(np.int32).reshape(-1, 1, 2)
         
-        for i in range(1, len(points)):
-            # Fade trail color based on age
-            alpha = i / len(points)
-            color = (int(255 * alpha), int(100 * alpha), int(255 * alpha))
-            thickness = max(1, int(3 * alpha))
-            
-            cv2.line(frame, points[i-1], points[i], color, thickness)
+        cv2.polylines(frame, [points], False, (255, 100, 255), 2, cv2.LINE_AA)
     
     def get_gesture_info(self, gesture_name: str) -> dict:
         """Get detailed information about a gesture"""
@@ -388,3 +728,90 @@ class AdvancedGestureDetector:
         }
         
         return gesture_info
+    
+    def release(self):
+        """Release detector resources"""
+        if self.landmark_backend is not None:
+            self.landmark_backend.close()
+
+
+# Detector owned by each ParallelDetector worker process
+_worker_detector = None
+
+def _init_worker(thread_count, detector_kwargs):
+    """Limit the worker's OpenCV threads and create the worker-local detector"""
+    global _worker_detector
+    # Spawned workers start with OpenCV's default pool of one thread per core
+    cv2.setNumThreads(thread_count)
+    _worker_detector = AdvancedGestureDetector(**detector_kwargs)
+
+def _worker_ready() -> bool:
+    """No-op task used to start and initialize the workers up front"""
+    return True
+
+def _worker_detect(frame_id, frame):
+    """Run per-frame detection in a worker: (frame_id, hand_center, static_gesture)"""
+    _worker_detector.detect_gesture(frame, draw=False)
+    return frame_id, _worker_detector.last_hand_center, _worker_detector.last_static_gesture
+
+class ParallelDetector:
+    """
+    Spreads per-frame hand detection over a process pool, one detector per worker.
+    Motion gestures need the hand positions in frame order, so they are tracked
+    here in the main process from the results collected in submission order.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, thread_count: int = 1, **detector_kwargs):
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_pending = self.max_workers * 2
+        # Spawned (not forked) workers: forking once the capture/GUI threads and
+        # OpenCV's thread pool are running can deadlock the child
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(thread_count, detector_kwargs)
+        )
+        
+        # Start every worker now, before the app starts its threads, instead of
+        # lazily on the first frames
+        warmup = [self.pool.submit(_worker_ready) for _ in range(self.max_workers)]
+        for future in warmup:
+            future.result()
+        self.pending = deque()
+        self.frame_id = 0
+        
+        # Lightweight local detector used only for motion tracking and gesture names;
+        # each worker calibrates its own background model
+        self.motion_detector = AdvancedGestureDetector(use_mediapipe=False, use_opencl=False)
+        self.motion_detector.calibrated = True
+    
+    def submit(self, frame) -> bool:
+        """Queue a frame for detection; drops it when all workers are busy"""
+        if len(self.pending) >= self.max_pending:
+            return False
+        
+        self.frame_id += 1
+        self.pending.append(self.pool.submit(_worker_detect, self.frame_id, frame))
+        return True
+    
+    def results(self) -> List[Optional[str]]:
+        """Collect finished detections in frame order and return their gestures"""
+        gestures = []
+        
+        while self.pending and self.pending[0].done():
+            _, hand_center, static_gesture = self.pending.popleft().result()
+            
+            motion_gesture = None
+            if hand_center is not None:
+                self.motion_detector._add_hand_position(hand_center)
+                motion_gesture = self.motion_detector._detect_motion_gesture()
+            
+            # Prioritize motion gestures over static poses
+            gestures.append(motion_gesture if motion_gesture else static_gesture)
+        
+        return gestures
+    
+    def shutdown(self):
+        """Stop the worker pool"""
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -1,6 +1,11 @@
 import BlynkLib as blynklib
 import time
+import queue
+import threading
+import multiprocessing
 from typing import Optional, Callable
+from config import DEVICE_NAMES
+from utils import put_latest
 
 class BlynkController:
     """
@@ -14,6 +19,10 @@ class BlynkController:
         self.last_update_time = 0
         self.min_update_interval = 1.0  # Minimum 1 second between updates
         
+        # Delayed writes (pin resets) flushed from run() instead of sleeping
+        self.scheduled_writes = []
+        self.scheduled_writes_lock = threading.Lock()
+        
         # Virtual pins for different devices/actions
         self.GESTURE_DISPLAY_PIN = 0  # V0 - Display current gesture
         self.DEVICE_1_PIN = 1         # V1 - Device 1 (Light 1)
@@ -22,6 +31,12 @@ class BlynkController:
         self.DEVICE_4_PIN = 4         # V4 - Device 4 (AC)
         self.DEVICE_5_PIN = 5         # V5 - Device 5 (TV)
         
+        # Last value written to each device pin (None = unknown, always written)
+        self.device_state = {pin: None for pin in (
+            self.DEVICE_1_PIN, self.DEVICE_2_PIN, self.DEVICE_3_PIN,
+            self.DEVICE_4_PIN, self.DEVICE_5_PIN
+        )}
+        
         self.connect_to_blynk()
     
     def connect_to_blynk(self):
@@ -73,6 +88,24 @@ class BlynkController:
                     return False
         return False
     
+    def schedule_write(self, delay: float, pin, value):
+        """Schedule a virtual pin write to be sent by run() after delay seconds"""
+        with self.scheduled_writes_lock:
+            self.scheduled_writes.append((time.time() + delay, pin, value))
+    
+    def _flush_scheduled_writes(self):
+        """Send scheduled writes that are due"""
+        if not self.scheduled_writes:
+            return
+        
+        now = time.time()
+        with self.scheduled_writes_lock:
+            due = [w for w in self.scheduled_writes if w[0] <= now]
+            self.scheduled_writes = [w for w in self.scheduled_writes if w[0] > now]
+        
+        for _, pin, value in sorted(due, key=lambda w: w[0]):
+            self.safe_virtual_write(pin, value)
+    
     def update_gesture(self, gesture_name: Optional[str]):
         """Update the current gesture and trigger corresponding actions"""
         if gesture_name is None:
@@ -116,22 +149,24 @@ class BlynkController:
         
         print(f"📱 Updating Blynk devices for gesture {gesture_number}")
         
-        # Turn off all devices first
-        for pin in device_pins.values():
-            self.safe_virtual_write(pin, 0)
-            time.sleep(0.1)  # Small delay between writes
+        # Turn off the other devices, writing only pins that are not already off
+        for number, pin in device_pins.items():
+            if number != gesture_number and self.device_state[pin] != 0:
+                if self.safe_virtual_write(pin, 0):
+                    self.device_state[pin] = 0
         
         # Turn on the selected device
         if gesture_number in device_pins:
-            success = self.safe_virtual_write(device_pins[gesture_number], 1)
+            pin = device_pins[gesture_number]
+            success = self.device_state[pin] == 1 or self.safe_virtual_write(pin, 1)
             if success:
+                self.device_state[pin] = 1
                 print(f"✅ Device {gesture_number} activated in Blynk")
                 
                 # Send status message to terminal
+                device_name = DEVICE_NAMES.get(gesture_number, f"Device {gesture_number}")
+                status_msg = f"✅ {device_name} activated by gesture {gesture_number}!"
                 try:
-                    from config import DEVICE_NAMES
-                    device_name = DEVICE_NAMES.get(gesture_number, f"Device {gesture_number}")
-                    status_msg = f"✅ {device_name} activated by gesture {gesture_number}!"
                     self.safe_virtual_write(10, status_msg)  # V10 for terminal
                     print(f"📱 Status sent: {status_msg}")
                 except Exception as e:
@@ -164,8 +199,7 @@ class BlynkController:
         if action == 'toggle':
             # Toggle device (simple on/off)
             success = self.safe_virtual_write(pin, 1)
-            time.sleep(0.2)
-            self.safe_virtual_write(pin, 0)  # Reset after brief activation
+            self.schedule_write(0.2, pin, 0)  # Reset after brief activation
             
         elif action == 'on':
             success = self.safe_virtual_write(pin, 1)
@@ -176,8 +210,7 @@ class BlynkController:
         elif action == 'activate':
             # Momentary activation for scenes/modes
             success = self.safe_virtual_write(pin, 1)
-            time.sleep(0.1)
-            self.safe_virtual_write(pin, 0)
+            self.schedule_write(0.1, pin, 0)
         
         if success:
             print(f"✅ {device_name} {action} executed successfully")
@@ -195,6 +228,7 @@ class BlynkController:
             
         try:
             self.blynk.run()
+            self._flush_scheduled_writes()
         except Exception as e:
             print(f"❌ Blynk run error: {e}")
             # Try to reconnect if connection is lost
@@ -228,4 +262,70 @@ class BlynkController:
             else:
                 return "Disconnected"
         except:
-            return "Error"
\ No newline at end of file
+            return "Error"
+
+def _blynk_worker(auth_token: str, gesture_q, stop_event, status):
+    """Child process loop: drain gestures from the queue and service Blynk"""
+    try:
+        controller = BlynkController(auth_token)
+    except Exception as e:
+        print(f"⚠️  Blynk initialization failed: {e}")
+        status.value = b"Offline"
+        return
+    
+    while not stop_event.is_set():
+        try:
+            gesture = gesture_q.get(timeout=0.01)
+        except queue.Empty:
+            gesture = None
+        
+        if gesture is not None:
+            try:
+                controller.update_gesture(gesture)
+            except Exception as e:
+                print(f"Blynk update error: {e}")
+        
+        controller.run()
+        status.value = controller.get_status().encode()
+
+class BlynkProcess:
+    """
+    Runs a BlynkController in a separate process so network I/O never
+    stalls the camera loop. Gestures are handed over through a small queue.
+    """
+    
+    def __init__(self, auth_token: str, queue_size: int = 2):
+        # Spawn rather than fork so the child doesn't inherit the camera,
+        # OpenCV thread pool or MediaPipe state from the parent
+        ctx = multiprocessing.get_context("spawn")
+        self.gesture_q = ctx.Queue(maxsize=queue_size)
+        self.stop_event = ctx.Event()
+        self.status = ctx.Array('c', 32)
+        self.status.value = b"Starting"
+        self.process = ctx.Process(
+            target=_blynk_worker,
+            args=(auth_token, self.gesture_q, self.stop_event, self.status),
+            daemon=True
+        )
+    
+    def start(self):
+        """Start the Blynk worker process"""
+        self.process.start()
+    
+    def stop(self):
+        """Stop the Blynk worker process"""
+        self.stop_event.set()
+        if self.process.is_alive():
+            self.process.join(timeout=1.0)
+    
+    def update_gesture(self, gesture):
+        """Queue a gesture for the worker, dropping the oldest one if full"""
+        put_latest(self.gesture_q, gesture)
+    
+    def is_connected(self) -> bool:
+        """Check if the worker's Blynk connection is up"""
+        return self.get_status() == "Connected"
+    
+    def get_status(self) -> str:
+        """Get the worker's current Blynk connection status"""
+        return self.status.value.decode()
@@ -10,8 +10,18 @@ CAMERA_INDEX = 0  # Default camera (usually 0 for built-in camera)
 CAMERA_WIDTH = 640
 CAMERA_HEIGHT = 480
 CAMERA_FPS = 30
+HEADLESS = False  # Skip the preview window (detection + Blynk only); stop with Ctrl+C
+
+# Threading Configuration
+# OpenCV's internal pool competes with the capture, detection and Blynk threads;
+# 2 suits 4-core Raspberry Pi class boards (0 disables OpenCV's own threading)
+THREAD_COUNT = 2
+CPU_AFFINITY = None  # e.g. {0, 1} to pin the app to those cores (Linux only)
 
 # Gesture Detection Configuration
+USE_MEDIAPIPE = True  # Use MediaPipe hand landmarks (falls back to OpenCV contours if not installed)
+USE_OPENCL = True  # Offload OpenCV skin segmentation to OpenCL when a device is available
+DETECTION_WORKERS = 0  # >1 runs detection in a pool of worker processes (advanced mode)
 MIN_DETECTION_CONFIDENCE = 0.7
 MIN_TRACKING_CONFIDENCE = 0.5
 GESTURE_STABILITY_THRESHOLD = 10  # Number of frames to confirm gesture (more stable)
@@ -6,59 +6,148 @@ Clean main file with OpenCV-only gesture detection
 
 import cv2
 import numpy as np
+import math
 import time
+import queue
+import signal
 import threading
 from typing import Optional, Tuple
 from config import *
 from blynk_controller import BlynkController
+from utils import njit, put_latest, configure_threads
+
+@njit(cache=True, fastmath=True)
+def count_fingers(defects, contour):
+    """Count acute, deep convexity defects (gaps between fingers)"""
+    finger_count = 0
+    
+    for i in range(defects.shape[0]):
+        s = defects[i, 0]
+        e = defects[i, 1]
+        f = defects[i, 2]
+        d = defects[i, 3]
+        
+        # Calculate triangle sides
+        a = math.sqrt((contour[e, 0] - contour[s, 0])**2 + (contour[e, 1] - contour[s, 1])**2)
+        b = math.sqrt((contour[f, 0] - contour[s, 0])**2 + (contour[f, 1] - contour[s, 1])**2)
+        c = math.sqrt((contour[e, 0] - contour[f, 0])**2 + (contour[e, 1] - contour[f, 1])**2)
+        
+        if b > 0 and c > 0:
+            cos_angle = min(1.0, max(-1.0, (b*b + c*c - a*a) / (2*b*c)))
+            
+            # Count as finger if angle is acute and defect is deep enough
+            if math.acos(cos_angle) <= math.pi/2 and d > 1000:
+                finger_count += 1
+    
+    return finger_count
+
+# Compile (or load from cache) at import so the first real frame is not delayed
+count_fingers(np.zeros((1, 4), dtype=np.int32), np.zeros((3, 2), dtype=np.int32))
+
+class OverlayCache:
+    """Pre-rendered overlay copied onto frames, redrawn only when its key changes"""
+    
+    BLACK = np.zeros(3, dtype=np.uint8)
+    
+    def __init__(self):
+        self.key = None
+        self.image = None
+        self.mask = None
+    
+    def apply(self, frame, key, draw):
+        """Copy the cached overlay onto frame, calling draw(image) first if key changed"""
+        if key != self.key or self.image is None or self.image.shape != frame.shape:
+            self.image = np.zeros_like(frame)
+            draw(self.image)
+            # Overlay pixels are never black, so everything but pure black is copied
+            self.mask = cv2.bitwise_not(cv2.inRange(self.image, self.BLACK, self.BLACK))
+            self.key = key
+        
+        cv2.copyTo(self.image, self.mask, frame)
 
 class SimpleGestureDetector:
     """Simple gesture detector using OpenCV contours"""
     
-    def __init__(self):
-        self.bg_subtractor = cv2.createBackgroundSubtractorMOG2(detectShadows=False)
-        self.kernel = np.ones((5, 5), np.uint8)
+    def __init__(self, use_opencl=True):
+        # Sized for the half-resolution mask (about 5x5 at full resolution)
+        self.kernel = np.ones((3, 3), np.uint8)
         self.calibrated = False
         self.calibration_frames = 0
         
+        # More restrictive skin color range. The skin region is a plain H/S/V box, so
+        # one vectorized cv2.inRange pass beats an H x S lookup table gather
+        self.lower_skin = np.array([0, 30, 80], dtype=np.uint8)
+        self.upper_skin = np.array([17, 255, 255], dtype=np.uint8)
+        
+        # Cheap BGR prefilter (R >= 80). For hues 0-17 red is the largest channel, so
+        # R equals V and this is a superset of the HSV skin range (never drops skin)
+        self.lower_bgr = np.array([0, 0, 80], dtype=np.uint8)
+        self.upper_bgr = np.array([255, 255, 255], dtype=np.uint8)
+        self.prefilter_fraction = 0.3  # Convert only the candidate box below this coverage
+        
+        # Reused per-frame buffers, allocated on the first frame to match the ROI
+        self.hsv_buf = None
+        self.mask_buf = None
+        self.bgr_mask_buf = None
+        
+        # OpenCL (T-API) offload of the per-pixel segmentation passes
+        self.use_opencl = False
+        if use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+            self.use_opencl = cv2.ocl.haveOpenCL()
+        
+        # Static overlays are rasterized once and copied; the debug line is drawn
+        # directly and its numbers refresh every 5th frame
+        self.zone_overlay = OverlayCache()
+        self.gesture_overlay = OverlayCache()
+        self.frame_index = 0
+        self.debug_text = ""
+        
+        # Detection zone bounds (y0, y1, x0, x1), fixed by the camera size on the first frame
+        self._roi = None
+        self._zone_rect = None
+        
+        # Device names indexed by gesture number (1-5)
+        self._device_names = tuple(DEVICE_NAMES.get(i, f"Device {i}") for i in range(6))
+        
     def calibrate(self, frame):
-        """Calibrate background subtractor"""
+        """Settle period before detection (camera exposure, hand out of view)"""
         if self.calibration_frames < 30:  # Calibrate for 30 frames
-            self.bg_subtractor.apply(frame)
             self.calibration_frames += 1
             return False
         else:
             self.calibrated = True
             return True
     
-    def detect_gesture(self, frame) -> Tuple[Optional[int], np.ndarray]:
-        """Detect gesture using improved hand detection"""
-        annotated_frame = frame.copy()
+    def detect_gesture(self, frame, draw: bool = True) -> Tuple[Optional[int], Optional[np.ndarray]]:
+        """
+        Detect gesture using improved hand detection
+        Returns: (gesture_number, annotated_frame), annotated_frame is None when draw is False
+        """
+        # The caller owns the frame, so overlays are drawn on it directly
+        annotated_frame = frame if draw else None
+        self.frame_index += 1
         
         if not self.calibrated:
             if not self.calibrate(frame):
-                cv2.putText(annotated_frame, "Calibrating... Keep hand out of view", 
-                           (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+                if draw:
+                    cv2.putText(annotated_frame, "Calibrating... Keep hand out of view", 
+                               (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
                 return None, annotated_frame
         
         # Focus on upper portion of frame (where hands usually are)
-        h, w = frame.shape[:2]
-        roi = frame[0:int(h*0.7), int(w*0.2):int(w*0.8)]  # Top 70%, middle 60%
-        
-        # Convert to HSV for better skin detection
-        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        if self._roi is None:
+            h, w = frame.shape[:2]
+            self._roi = (0, int(h*0.7), int(w*0.2), int(w*0.8))  # Top 70%, middle 60%
+            self._zone_rect = ((self._roi[2], self._roi[0]), (self._roi[3], self._roi[1]))
         
-        # More restrictive skin color range
-        lower_skin = np.array([0, 30, 80], dtype=np.uint8)
-        upper_skin = np.array([17, 255, 255], dtype=np.uint8)
+        roi_y0, roi_y1, roi_x0, roi_x1 = self._roi
+        roi = frame[roi_y0:roi_y1, roi_x0:roi_x1]
         
-        # Create mask
-        mask = cv2.inRange(hsv, lower_skin, upper_skin)
-        
-        # More aggressive noise reduction
-        kernel_small = np.ones((3, 3), np.uint8)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel_small, iterations=2)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.kernel, iterations=1)
+        if self.use_opencl:
+            mask = self._skin_mask_opencl(roi)
+        else:
+            mask = self._skin_mask(roi)
         
         # Find contours
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -70,97 +159,144 @@ class SimpleGestureDetector:
             valid_contours = []
             for contour in contours:
                 area = cv2.contourArea(contour)
-                # Much stricter area limits for hand detection
-                if 3000 < area < 15000:  # Hand-sized objects only
+                # Much stricter area limits for hand detection (on the half-resolution mask)
+                if 750 < area < 3750:  # Hand-sized objects only
                     # Check if contour is roughly hand-shaped
                     perimeter = cv2.arcLength(contour, True)
                     if perimeter > 0:
                         circularity = 4 * np.pi * area / (perimeter * perimeter)
                         # Hands are not too circular (0.1 to 0.8)
                         if 0.1 < circularity < 0.8:
-                            valid_contours.append(contour)
+                            valid_contours.append((area, contour))
             
             if valid_contours:
-                # Use the largest valid contour
-                largest_contour = max(valid_contours, key=cv2.contourArea)
-                area = cv2.contourArea(largest_contour)
+                # Use the largest valid contour, scaled back to full resolution
+                # (area is measured once per contour; doubling the coordinates quadruples it)
+                area, largest_contour = max(valid_contours, key=lambda item: item[0])
+                largest_contour = largest_contour * 2
+                area *= 4
                 
-                # Adjust contour coordinates back to full frame
-                offset_x = int(w*0.2)
-                offset_y = 0
-                adjusted_contour = largest_contour + [offset_x, offset_y]
-                
-                # Draw contour on full frame
-                cv2.drawContours(annotated_frame, [adjusted_contour], -1, (0, 255, 0), 2)
+                if draw:
+                    # Adjust contour coordinates back to full frame
+                    adjusted_contour = largest_contour + [roi_x0, roi_y0]
+                    
+                    # Draw contour on full frame
+                    cv2.drawContours(annotated_frame, [adjusted_contour], -1, (0, 255, 0), 2)
                 
-                # More sophisticated gesture recognition
-                hull = cv2.convexHull(largest_contour)
-                hull_area = cv2.contourArea(hull)
+                # More sophisticated gesture recognition: one hull pass gives both
+                # the indices for convexityDefects and the points for the hull area
+                hull_indices = cv2.convexHull(largest_contour, returnPoints=False)
+                # Measure the area while the indices are still in hull order
+                hull_area = cv2.contourArea(largest_contour[hull_indices[:, 0]])
+                # convexityDefects needs monotonic indices
+                hull_indices[::-1].sort(axis=0)
                 
                 if hull_area > 0:
                     solidity = area / hull_area
                     
                     # Count convexity defects (fingers)
-                    hull_indices = cv2.convexHull(largest_contour, returnPoints=False)
                     if len(hull_indices) > 3:
                         defects = cv2.convexityDefects(largest_contour, hull_indices)
                         finger_count = 0
                         
                         if defects is not None:
-                            for i in range(defects.shape[0]):
-                                s, e, f, d = defects[i, 0]
-                                start = tuple(largest_contour[s][0])
-                                end = tuple(largest_contour[e][0])
-                                far = tuple(largest_contour[f][0])
-                                
-                                # Calculate angle
-                                a = np.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
-                                b = np.sqrt((far[0] - start[0])**2 + (far[1] - start[1])**2)
-                                c = np.sqrt((end[0] - far[0])**2 + (end[1] - far[1])**2)
-                                
-                                if b > 0 and c > 0:
-                                    angle = np.arccos((b**2 + c**2 - a**2) / (2*b*c))
-                                    
-                                    # Count as finger if angle is acute and defect is deep enough
-                                    if angle <= np.pi/2 and d > 1000:
-                                        finger_count += 1
+                            finger_count = count_fingers(
+                                np.ascontiguousarray(defects.reshape(-1, 4), dtype=np.int32),
+                                np.ascontiguousarray(largest_contour.reshape(-1, 2), dtype=np.int32)
+                            )
                         
                         # Add 1 for thumb (simple heuristic)
                         gesture_number = min(finger_count + 1, 5)
-                        
-                        # Fallback to area-based if finger counting fails
-                        if gesture_number == 0 or gesture_number > 5:
-                            if area < 5000:
-                                gesture_number = 1
-                            elif area < 7000:
-                                gesture_number = 2
-                            elif area < 9000:
-                                gesture_number = 3
-                            elif area < 11000:
-                                gesture_number = 4
-                            else:
-                                gesture_number = 5
                     
                     # Only show gesture if confidence is high
                     if gesture_number and 1 <= gesture_number <= 5:
                         # Additional validation: check solidity
                         if solidity > 0.5:  # Hand should have reasonable solidity
-                            device_name = DEVICE_NAMES.get(gesture_number, f"Device {gesture_number}")
-                            cv2.putText(annotated_frame, f"Gesture: {gesture_number} - {device_name}", 
-                                       (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
-                            
-                            # Debug info
-                            cv2.putText(annotated_frame, f"Area: {int(area)}, Solidity: {solidity:.2f}", 
-                                       (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+                            if draw:
+                                if self.frame_index % 5 == 0 or not self.debug_text:
+                                    self.debug_text = f"Area: {int(area)}, Solidity: {solidity:.2f}"
+                                
+                                self.gesture_overlay.apply(
+                                    annotated_frame, gesture_number,
+                                    lambda image: self._draw_gesture_text(image, gesture_number)
+                                )
+                                
+                                # Debug info
+                                cv2.putText(annotated_frame, self.debug_text, 
+                                           (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
                         else:
                             gesture_number = None
         
-        # Show detection area
-        cv2.rectangle(annotated_frame, (int(w*0.2), 0), (int(w*0.8), int(h*0.7)), (255, 0, 0), 2)
-        cv2.putText(annotated_frame, "Detection Zone", (int(w*0.2), 25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
+        if draw:
+            # Show detection area
+            self.zone_overlay.apply(annotated_frame, None, self._draw_detection_zone)
         
         return gesture_number, annotated_frame
+    
+    def _skin_mask(self, roi):
+        """Half-resolution skin mask, converting to HSV only where the BGR prefilter allows"""
+        # Segment at half resolution (4x fewer pixels); hand contours are coarse
+        roi = cv2.resize(roi, (roi.shape[1] // 2, roi.shape[0] // 2), interpolation=cv2.INTER_AREA)
+        
+        if self.hsv_buf is None or self.hsv_buf.shape[:2] != roi.shape[:2]:
+            self.hsv_buf = np.empty(roi.shape, dtype=np.uint8)
+            self.mask_buf = np.empty(roi.shape[:2], dtype=np.uint8)
+            self.bgr_mask_buf = np.empty(roi.shape[:2], dtype=np.uint8)
+        
+        # Cheap BGR prefilter decides how much of the ROI needs the HSV conversion;
+        # skin hues (0-17) have red as the max channel, so V >= 80 already implies R >= 80
+        bgr_mask = cv2.inRange(roi, self.lower_bgr, self.upper_bgr, dst=self.bgr_mask_buf)
+        candidates = cv2.countNonZero(bgr_mask)
+        mask = self.mask_buf
+        
+        if candidates == 0:
+            mask[:] = 0
+        elif candidates < bgr_mask.size * self.prefilter_fraction:
+            # Convert to HSV only inside the bounding box of candidate pixels
+            x, y, bw, bh = cv2.boundingRect(bgr_mask)
+            hsv_box = cv2.cvtColor(roi[y:y+bh, x:x+bw], cv2.COLOR_BGR2HSV)
+            mask[:] = 0
+            mask[y:y+bh, x:x+bw] = cv2.inRange(hsv_box, self.lower_skin, self.upper_skin)
+        else:
+            # Convert to HSV for better skin detection
+            hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV, dst=self.hsv_buf)
+            
+            # Create mask
+            mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin, dst=mask)
+        
+        # More aggressive noise reduction, scaled down with the mask so finger gaps survive
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.kernel, dst=mask, iterations=1)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.kernel, dst=mask, iterations=1)
+        
+        return mask
+    
+    def _skin_mask_opencl(self, roi):
+        """Full-ROI skin mask computed on the OpenCL device"""
+        roi = cv2.UMat(roi)
+        roi = cv2.resize(roi, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        
+        # The GPU converts the whole ROI faster than the CPU prefilter can skip it
+        hsv = cv2.cvtColor(roi, cv2.COLOR_BGR2HSV)
+        mask = cv2.inRange(hsv, self.lower_skin, self.upper_skin)
+        
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.kernel, iterations=1)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.kernel, iterations=1)
+        
+        # findContours runs on the CPU
+        return mask.get()
+    
+    def _draw_gesture_text(self, image, gesture_number):
+        """Draw the detected gesture"""
+        device_name = self._device_names[gesture_number]
+        cv2.putText(image, f"Gesture: {gesture_number} - {device_name}", 
+                   (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
+    
+    def _draw_detection_zone(self, image):
+        """Draw the detection zone rectangle and label"""
+        top_left, bottom_right = self._zone_rect
+        cv2.rectangle(image, top_left, bottom_right, (255, 0, 0), 2)
+        cv2.putText(image, "Detection Zone", (top_left[0], 25), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
 
 class SmartHomeGestureControl:
     """Main application class"""
@@ -168,7 +304,9 @@ class SmartHomeGestureControl:
     def __init__(self):
         print("🏠 Initializing Smart Home Gesture Control...")
         
-        self.gesture_detector = SimpleGestureDetector()
+        configure_threads(THREAD_COUNT, CPU_AFFINITY)
+        
+        self.gesture_detector = SimpleGestureDetector(use_opencl=USE_OPENCL)
         self.blynk_controller = None
         
         # Initialize Blynk
@@ -182,6 +320,17 @@ class SmartHomeGestureControl:
         self.last_gesture = None
         self.gesture_stable_count = 0
         
+        # Blynk availability is fixed after init; connection state is
+        # refreshed by the Blynk thread so the overlay never queries it
+        self._blynk_active = bool(self.blynk_controller and getattr(self.blynk_controller, 'blynk', None))
+        self._blynk_connected = False
+        
+        # Status text only changes with calibration/Blynk state, so it is cached
+        self.info_overlay = OverlayCache()
+        
+        # Device names indexed by gesture number (1-5)
+        self._device_names = tuple(DEVICE_NAMES.get(i, f"Device {i}") for i in range(6))
+        
     def start(self):
         """Start the system"""
         print("🚀 Starting Smart Home Gesture Control System...")
@@ -197,13 +346,14 @@ class SmartHomeGestureControl:
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
         cap.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Keep only the newest frame in the driver
         
         print(f"📹 Camera: {int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))}")
         
         self.running = True
         
         # Start Blynk thread if available
-        if self.blynk_controller and hasattr(self.blynk_controller, 'blynk') and self.blynk_controller.blynk:
+        if self._blynk_active:
             blynk_thread = threading.Thread(target=self._run_blynk)
             blynk_thread.daemon = True
             blynk_thread.start()
@@ -215,14 +365,20 @@ class SmartHomeGestureControl:
         self._main_loop(cap)
         
         cap.release()
-        cv2.destroyAllWindows()
+        if not HEADLESS:
+            cv2.destroyAllWindows()
         return True
     
     def _run_blynk(self):
         """Run Blynk in separate thread"""
-        while self.running and self.blynk_controller and hasattr(self.blynk_controller, 'blynk') and self.blynk_controller.blynk:
+        # Only started when Blynk is active, and the controller never changes after init
+        blynk_run = self.blynk_controller.run
+        blynk_is_connected = self.blynk_controller.is_connected
+        
+        while self.running:
             try:
-                self.blynk_controller.run()
+                blynk_run()
+                self._blynk_connected = blynk_is_connected()
                 time.sleep(0.01)
             except Exception as e:
                 print(f"Blynk error: {e}")
@@ -236,25 +392,28 @@ class SmartHomeGestureControl:
         print("   - Show clear gestures with 1-5 fingers")
         print("   - Press 'q' to quit, 's' for status")
         
-        frame_count = 0
+        # Capture and detection run in worker threads; the GUI stays on this thread
+        cap_q = queue.Queue(maxsize=2)
+        render_q = queue.Queue(maxsize=2)
+        capture_thread = threading.Thread(target=self._capture_loop, args=(cap, cap_q), daemon=True)
+        detect_thread = threading.Thread(target=self._detect_loop, args=(cap_q, render_q), daemon=True)
+        capture_thread.start()
+        detect_thread.start()
+        
+        # Without a window there is no 'q' key, so Ctrl+C stops the loop instead
+        previous_sigint = None
+        if HEADLESS:
+            previous_sigint = signal.signal(signal.SIGINT, self._handle_sigint)
+            print("🖥️  Headless mode: no preview window, press Ctrl+C to quit")
         
         while self.running:
-            ret, frame = cap.read()
-            
-            if not ret:
-                print("❌ Failed to read from camera")
-                break
-            
-            frame_count += 1
-            
-            # Mirror effect for natural interaction
-            frame = cv2.flip(frame, 1)
+            try:
+                annotated_frame, frame_count = render_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
             
-            # Detect gesture - SINGLE DETECTION, NO EXTRA WINDOWS
-            gesture_number, annotated_frame = self.gesture_detector.detect_gesture(frame)
-            
-            # Process gesture with stability
-            self._process_gesture(gesture_number)
+            if HEADLESS:
+                continue
             
             # Add system info
             self._add_system_info(annotated_frame, frame_count)
@@ -275,6 +434,65 @@ class SmartHomeGestureControl:
                 print("🔄 Recalibrating...")
         
         self.running = False
+        capture_thread.join(timeout=1.0)
+        detect_thread.join(timeout=1.0)
+        
+        if previous_sigint is not None:
+            signal.signal(signal.SIGINT, previous_sigint)
+    
+    def _handle_sigint(self, signum, frame):
+        """Stop the main loop on Ctrl+C in headless mode"""
+        print("\n🛑 Stopping...")
+        self.running = False
+    
+    def _capture_loop(self, cap, cap_q):
+        """Grab camera frames and queue the newest one for detection"""
+        frame_count = 0
+        
+        while self.running:
+            # Always grab so stale frames are discarded, but only decode
+            # when the detector has taken the previous frame
+            if not cap.grab():
+                print("❌ Failed to read from camera")
+                self.running = False
+                break
+            
+            frame_count += 1
+            
+            if not cap_q.empty():
+                continue
+            
+            ret, frame = cap.retrieve()
+            if not ret:
+                print("❌ Failed to read from camera")
+                self.running = False
+                break
+            
+            # Mirror effect for natural interaction (in place, no new frame buffer)
+            cv2.flip(frame, 1, dst=frame)
+            
+            put_latest(cap_q, (frame, frame_count))
+    
+    def _detect_loop(self, cap_q, render_q):
+        """Detect gestures on captured frames and hand annotated frames to the GUI"""
+        while self.running:
+            try:
+                frame, frame_count = cap_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            # Detect gesture - SINGLE DETECTION, NO EXTRA WINDOWS
+            try:
+                gesture_number, annotated_frame = self.gesture_detector.detect_gesture(frame, draw=not HEADLESS)
+            except Exception as e:
+                print(f"❌ Gesture detection error: {e}")
+                self.running = False
+                break
+            
+            # Process gesture with stability
+            self._process_gesture(gesture_number)
+            
+            put_latest(render_q, (annotated_frame, frame_count))
     
     def _process_gesture(self, gesture_number):
         """Process detected gesture with stability checking"""
@@ -288,7 +506,7 @@ class SmartHomeGestureControl:
         if (self.gesture_stable_count >= GESTURE_STABILITY_THRESHOLD and 
             gesture_number is not None):
             
-            device_name = DEVICE_NAMES.get(gesture_number, f"Device {gesture_number}")
+            device_name = self._device_names[gesture_number]
             print(f"🎯 Gesture {gesture_number} detected - {device_name}")
             
             # Send to Blynk if available
@@ -302,6 +520,12 @@ class SmartHomeGestureControl:
     
     def _add_system_info(self, frame, frame_count):
         """Add system information to frame"""
+        active_gesture = self.blynk_controller.current_gesture if self.blynk_controller else 0
+        key = (self.gesture_detector.calibrated, self._blynk_active, self._blynk_connected, active_gesture)
+        self.info_overlay.apply(frame, key, lambda image: self._draw_system_info(image, active_gesture))
+    
+    def _draw_system_info(self, frame, active_gesture):
+        """Draw system information onto the overlay image"""
         h, w = frame.shape[:2]
         
         # Instructions
@@ -310,13 +534,13 @@ class SmartHomeGestureControl:
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
         
         # Blynk status
-        if self.blynk_controller and hasattr(self.blynk_controller, 'blynk') and self.blynk_controller.blynk:
-            try:
-                status = "Connected" if self.blynk_controller.is_connected() else "Connecting..."
-                color = (0, 255, 0) if self.blynk_controller.is_connected() else (0, 255, 255)
-            except:
-                status = "Error"
-                color = (0, 0, 255)
+        if self._blynk_active:
+            if self._blynk_connected:
+                status = "Connected"
+                color = (0, 255, 0)
+            else:
+                status = "Connecting..."
+                color = (0, 255, 255)
         else:
             status = "Offline Mode"
             color = (128, 128, 128)
@@ -325,9 +549,8 @@ class SmartHomeGestureControl:
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
         
         # Current active device
-        if (self.blynk_controller and hasattr(self.blynk_controller, 'current_gesture') and 
-            self.blynk_controller.current_gesture > 0):
-            device = DEVICE_NAMES.get(self.blynk_controller.current_gesture, "Unknown")
+        if active_gesture > 0:
+            device = DEVICE_NAMES.get(active_gesture, "Unknown")
             cv2.putText(frame, f"Active: {device}", (10, h - 30), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
         
@@ -6,12 +6,14 @@ Complex gesture recognition with static poses and motion gestures
 
 import cv2
 import numpy as np
-import time
+import queue
+import signal
 import threading
 from typing import Optional, Tuple
 from config import *
-from advanced_gesture_detector import AdvancedGestureDetector
-from blynk_controller import BlynkController
+from advanced_gesture_detector import AdvancedGestureDetector, ParallelDetector
+from blynk_controller import BlynkProcess
+from utils import put_latest, configure_threads
 
 class AdvancedSmartHomeGestureControl:
     """
@@ -23,18 +25,30 @@ class AdvancedSmartHomeGestureControl:
         print("🎯 Supporting complex gestures: 👌👋✌️👍👎🤘🤟🤞🤙✊✋")
         print("🔄 Motion gestures: Wave, Swipe Left/Right")
         
-        self.gesture_detector = AdvancedGestureDetector()
-        self.blynk_controller = None
+        configure_threads(THREAD_COUNT, CPU_AFFINITY)
         
-        # Initialize Blynk
-        try:
-            self.blynk_controller = BlynkController(BLYNK_AUTH_TOKEN)
-        except Exception as e:
-            print(f"⚠️  Blynk initialization failed: {e}")
-            print("📱 Running in offline mode - gestures will be detected but not sent to Blynk")
+        detector_kwargs = dict(
+            use_mediapipe=USE_MEDIAPIPE,
+            min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+            min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
+            use_opencl=USE_OPENCL
+        )
+        
+        # Optionally spread detection over several worker processes
+        self.parallel_detector = None
+        if DETECTION_WORKERS > 1:
+            self.parallel_detector = ParallelDetector(DETECTION_WORKERS, thread_count=THREAD_COUNT, **detector_kwargs)
+            self.gesture_detector = self.parallel_detector.motion_detector
+            print(f"⚙️  Parallel detection with {DETECTION_WORKERS} worker processes")
+        else:
+            self.gesture_detector = AdvancedGestureDetector(**detector_kwargs)
+        
+        # Blynk runs in its own process so network I/O never stalls the camera loop
+        self.blynk_process = BlynkProcess(BLYNK_AUTH_TOKEN)
         
         self.running = False
         self.last_gesture = None
+        self.active_gesture = None
         self.gesture_stable_count = 0
         self.gesture_stats = {}
         
@@ -57,37 +71,28 @@ class AdvancedSmartHomeGestureControl:
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
         cap.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Keep only the newest frame in the driver
         
         print(f"📹 Camera: {int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x{int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))}")
         
         self.running = True
         
-        # Start Blynk thread if available
-        if self.blynk_controller and hasattr(self.blynk_controller, 'blynk') and self.blynk_controller.blynk:
-            blynk_thread = threading.Thread(target=self._run_blynk)
-            blynk_thread.daemon = True
-            blynk_thread.start()
-            print("📱 Advanced Blynk integration active")
-        else:
-            print("📱 Running in offline mode")
+        # Start Blynk worker process
+        self.blynk_process.start()
+        print("📱 Advanced Blynk integration started")
         
         # Main loop
         self._main_loop(cap)
         
         cap.release()
-        cv2.destroyAllWindows()
+        self.blynk_process.stop()
+        if self.parallel_detector:
+            self.parallel_detector.shutdown()
+        self.gesture_detector.release()
+        if not HEADLESS:
+            cv2.destroyAllWindows()
         return True
     
-    def _run_blynk(self):
-        """Run Blynk in separate thread"""
-        while self.running and self.blynk_controller and hasattr(self.blynk_controller, 'blynk') and self.blynk_controller.blynk:
-            try:
-                self.blynk_controller.run()
-                time.sleep(0.01)
-            except Exception as e:
-                print(f"Blynk error: {e}")
-                time.sleep(1)
-    
     def _main_loop(self, cap):
         """Main processing loop for advanced gesture detection"""
         print("👋 Advanced Gesture System Ready!")
@@ -96,25 +101,28 @@ class AdvancedSmartHomeGestureControl:
         print("   Motion: 👋 Wave, ← Swipe Left, → Swipe Right")
         print("   Controls: 'q' quit, 's' status, 'r' recalibrate, 'g' gesture stats")
         
-        frame_count = 0
+        # Capture and detection run in worker threads; the GUI stays on this thread
+        cap_q = queue.Queue(maxsize=2)
+        render_q = queue.Queue(maxsize=2)
+        capture_thread = threading.Thread(target=self._capture_loop, args=(cap, cap_q), daemon=True)
+        detect_thread = threading.Thread(target=self._detect_loop, args=(cap_q, render_q), daemon=True)
+        capture_thread.start()
+        detect_thread.start()
+        
+        # Without a window there is no 'q' key, so Ctrl+C stops the loop instead
+        previous_sigint = None
+        if HEADLESS:
+            previous_sigint = signal.signal(signal.SIGINT, self._handle_sigint)
+            print("🖥️  Headless mode: no preview window, press Ctrl+C to quit")
         
         while self.running:
-            ret, frame = cap.read()
-            
-            if not ret:
-                print("❌ Failed to read from camera")
-                break
-            
-            frame_count += 1
-            
-            # Mirror effect for natural interaction
-            frame = cv2.flip(frame, 1)
-            
-            # Detect advanced gestures
-            gesture_name, annotated_frame = self.gesture_detector.detect_gesture(frame)
+            try:
+                annotated_frame, frame_count = render_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
             
-            # Process gesture with stability
-            self._process_advanced_gesture(gesture_name)
+            if HEADLESS:
+                continue
             
             # Add system info
             self._add_advanced_system_info(annotated_frame, frame_count)
@@ -129,14 +137,83 @@ class AdvancedSmartHomeGestureControl:
             elif key == ord('s'):
                 self._show_status()
             elif key == ord('r'):
-                # Reset calibration
-                self.gesture_detector.calibrated = False
-                self.gesture_detector.calibration_frames = 0
-                print("🔄 Recalibrating advanced gesture detection...")
+                if self.parallel_detector:
+                    print("⚠️  Recalibration is not available with parallel detection")
+                else:
+                    # Reset calibration
+                    self.gesture_detector.calibrated = False
+                    self.gesture_detector.calibration_frames = 0
+                    print("🔄 Recalibrating advanced gesture detection...")
             elif key == ord('g'):
                 self._show_gesture_stats()
         
         self.running = False
+        capture_thread.join(timeout=1.0)
+        detect_thread.join(timeout=1.0)
+        
+        if previous_sigint is not None:
+            signal.signal(signal.SIGINT, previous_sigint)
+    
+    def _handle_sigint(self, signum, frame):
+        """Stop the main loop on Ctrl+C in headless mode"""
+        print("\n🛑 Stopping...")
+        self.running = False
+    
+    def _capture_loop(self, cap, cap_q):
+        """Grab camera frames and queue the newest one for detection"""
+        frame_count = 0
+        
+        while self.running:
+            # Always grab so stale frames are discarded, but only decode
+            # when the detector has taken the previous frame
+            if not cap.grab():
+                print("❌ Failed to read from camera")
+                self.running = False
+                break
+            
+            frame_count += 1
+            
+            if not cap_q.empty():
+                continue
+            
+            ret, frame = cap.retrieve()
+            if not ret:
+                print("❌ Failed to read from camera")
+                self.running = False
+                break
+            
+            # Mirror effect for natural interaction (in place, no new frame buffer)
+            cv2.flip(frame, 1, dst=frame)
+            
+            put_latest(cap_q, (frame, frame_count))
+    
+    def _detect_loop(self, cap_q, render_q):
+        """Detect gestures on captured frames and hand annotated frames to the GUI"""
+        while self.running:
+            try:
+                frame, frame_count = cap_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            
+            try:
+                if self.parallel_detector:
+                    # Workers detect without annotations; results arrive in frame order
+                    self.parallel_detector.submit(frame)
+                    for gesture_name in self.parallel_detector.results():
+                        self._process_advanced_gesture(gesture_name)
+                    annotated_frame = frame
+                else:
+                    # Detect advanced gestures (annotations are skipped when nothing is shown)
+                    gesture_name, annotated_frame = self.gesture_detector.detect_gesture(frame, draw=not HEADLESS)
+                    
+                    # Process gesture with stability
+                    self._process_advanced_gesture(gesture_name)
+            except Exception as e:
+                print(f"❌ Gesture detection error: {e}")
+                self.running = False
+                break
+            
+            put_latest(render_q, (annotated_frame, frame_count))
     
     def _process_advanced_gesture(self, gesture_name):
         """Process detected advanced gesture with stability checking"""
@@ -167,12 +244,9 @@ class AdvancedSmartHomeGestureControl:
             
             print(f"🎯 {gesture_type.title()} Gesture: {display_name}")
             
-            # Send to Blynk if available
-            if self.blynk_controller and hasattr(self.blynk_controller, 'update_gesture'):
-                try:
-                    self.blynk_controller.update_gesture(gesture_name)
-                except Exception as e:
-                    print(f"Blynk update error: {e}")
+            # Hand off to the Blynk worker (never blocks)
+            self.blynk_process.update_gesture(gesture_name)
+            self.active_gesture = gesture_name
             
             # Show device action
             if gesture_name in GESTURE_DEVICE_MAPPING:
@@ -191,26 +265,26 @@ class AdvancedSmartHomeGestureControl:
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
         
         # Blynk status
-        if self.blynk_controller and hasattr(self.blynk_controller, 'blynk') and self.blynk_controller.blynk:
-            try:
-                status = "Connected" if self.blynk_controller.is_connected() else "Connecting..."
-                color = (0, 255, 0) if self.blynk_controller.is_connected() else (0, 255, 255)
-            except:
-                status = "Error"
-                color = (0, 0, 255)
-        else:
+        status = self.blynk_process.get_status()
+        if status == "Connected":
+            color = (0, 255, 0)
+        elif status == "Offline":
             status = "Offline Mode"
             color = (128, 128, 128)
+        elif status == "Error":
+            color = (0, 0, 255)
+        else:
+            status = "Connecting..."
+            color = (0, 255, 255)
         
         cv2.putText(frame, f"Blynk: {status}", (10, h - 90), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
         
         # Current active gesture
-        if (self.blynk_controller and hasattr(self.blynk_controller, 'current_gesture') and 
-            self.blynk_controller.current_gesture):
+        if self.active_gesture:
             gesture_display = self.gesture_detector.gesture_names.get(
-                self.blynk_controller.current_gesture, 
-                self.blynk_controller.current_gesture
+                self.active_gesture, 
+                self.active_gesture
             )
             cv2.putText(frame, f"Active: {gesture_display}", (10, h - 60), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
@@ -235,22 +309,14 @@ class AdvancedSmartHomeGestureControl:
         print(f"   - Static Poses: {len(STATIC_GESTURES)}")
         print(f"   - Motion Gestures: {len(MOTION_GESTURES)}")
         
-        if self.blynk_controller:
-            if hasattr(self.blynk_controller, 'blynk') and self.blynk_controller.blynk:
-                try:
-                    connected = self.blynk_controller.is_connected()
-                    print(f"📱 Blynk: {'Connected' if connected else 'Disconnected'}")
-                    if hasattr(self.blynk_controller, 'current_gesture'):
-                        current = self.blynk_controller.current_gesture
-                        if current:
-                            display_name = self.gesture_detector.gesture_names.get(current, current)
-                            print(f"🎯 Current Gesture: {display_name}")
-                except:
-                    print("📱 Blynk: Error checking status")
-            else:
-                print("📱 Blynk: Offline mode")
+        status = self.blynk_process.get_status()
+        if status == "Offline":
+            print("📱 Blynk: Offline mode")
         else:
-            print("📱 Blynk: Not initialized")
+            print(f"📱 Blynk: {status}")
+            if self.active_gesture:
+                display_name = self.gesture_detector.gesture_names.get(self.active_gesture, self.active_gesture)
+                print(f"🎯 Current Gesture: {display_name}")
         
         print(f"🔄 Gesture Stability: {self.gesture_stable_count}/{GESTURE_STABILITY_THRESHOLD}")
         print("=" * 40)
@@ -0,0 +1,54 @@
+"""
+Contour-fallback pose tests on synthetic fist-plus-finger frames
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from advanced_gesture_detector import AdvancedGestureDetector
+
+SKIN_BGR = (120, 160, 220)
+BACKGROUND = 40
+
+def _hand_frame(kind, scale):
+    """Fist with one finger: 'up' / 'down' thumb or an upright pointing index finger"""
+    frame = np.full((480, 640, 3), BACKGROUND, np.uint8)
+    cx, cy = 320, 240
+    fist_w, fist_h = int(40 * scale), int(35 * scale)
+    if kind == 'point':
+        finger_w, finger_len = int(14 * scale), int(70 * scale)
+    else:
+        finger_w, finger_len = int(22 * scale), int(55 * scale)
+    
+    fist_cy = cy + int(20 * scale)
+    cv2.ellipse(frame, (cx, fist_cy), (fist_w, fist_h), 0, 0, 360, SKIN_BGR, -1)
+    
+    top = fist_cy - fist_h - finger_len
+    x = cx - fist_w // 2
+    cv2.rectangle(frame, (x, top + finger_w // 2), (x + finger_w, cy), SKIN_BGR, -1)
+    cv2.circle(frame, (x + finger_w // 2, top + finger_w // 2), finger_w // 2, SKIN_BGR, -1)
+    
+    if kind == 'down':
+        frame = cv2.flip(frame, 0)
+    return frame
+
+def _detect(frame):
+    detector = AdvancedGestureDetector(use_mediapipe=False, use_opencl=False)
+    background = np.full_like(frame, BACKGROUND)
+    while not detector.calibrated:
+        detector.detect_gesture(background, draw=False)
+    gesture, _ = detector.detect_gesture(frame, draw=False)
+    return gesture
+
+@pytest.mark.parametrize("scale", [0.8, 1.0, 1.3])
+def test_upright_thumbs_up_is_not_thumbs_down(scale):
+    assert _detect(_hand_frame('up', scale)) != 'thumbs_down'
+
+@pytest.mark.parametrize("scale", [0.8, 1.0, 1.3])
+def test_upright_thumbs_down_is_not_thumbs_up(scale):
+    assert _detect(_hand_frame('down', scale)) != 'thumbs_up'
+
+@pytest.mark.parametrize("scale", [0.8, 1.0, 1.3])
+def test_pointing_finger_is_not_a_thumbs_gesture(scale):
+    assert _detect(_hand_frame('point', scale)) not in ('thumbs_up', 'thumbs_down')
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the gesture control apps
+Queue handling, thread setup and the optional numba import
+"""
+
+import cv2
+import os
+import queue
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: run the plain Python function"""
+        def decorator(func):
+            return func
+        return decorator
+
+def put_latest(q, item):
+    """Put item on a bounded queue, dropping the oldest entry when full"""
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass
+
+def configure_threads(thread_count: int, cpu_affinity=None):
+    """Limit OpenCV's thread pool and optionally pin the process to cpu_affinity"""
+    cv2.setNumThreads(thread_count)
+    
+    if cpu_affinity and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, cpu_affinity)
+        except OSError as e:
+            print(f"⚠️  Could not set CPU affinity: {e}")